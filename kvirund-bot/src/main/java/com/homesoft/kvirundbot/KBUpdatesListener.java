@@ -97,7 +97,7 @@ public class KBUpdatesListener implements UpdatesListener {
                             break;
 
                         case bot_command:
-                            processBotCommand(message.text().substring(entity.offset(), entity.length()), message);
+                            processBotCommand(message.text().substring(entity.offset(), entity.offset() + entity.length()), message);
                             break;
 
                         default: